@@ -5,6 +5,121 @@ Unitless: use a consistent unit system for k, F, and u.
 from __future__ import annotations
 from typing import List, Tuple
 import numpy as np
+import scipy.linalg as sla
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+try: # numba is optional; the NumPy fallbacks below are equivalent
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+if _HAVE_NUMBA:
+    # parallel=True splits the element loops across cores; the triplet
+    # slots are disjoint per element, so there are no write conflicts and
+    # all outputs are preallocated outside the parallel region.
+    @njit(parallel=True, cache=True)
+    def _assemble_triplets(elem_i, elem_j, elem_k):
+        m = elem_i.shape[0]
+        rows = np.empty(4 * m, dtype=np.intp)
+        cols = np.empty(4 * m, dtype=np.intp)
+        data = np.empty(4 * m, dtype=elem_k.dtype)
+        for e in prange(m):
+            i, j, k = elem_i[e], elem_j[e], elem_k[e]
+            b = 4 * e
+            rows[b] = i;     cols[b] = i;     data[b] = k
+            rows[b + 1] = i; cols[b + 1] = j; data[b + 1] = -k
+            rows[b + 2] = j; cols[b + 2] = i; data[b + 2] = -k
+            rows[b + 3] = j; cols[b + 3] = j; data[b + 3] = k
+        return rows, cols, data
+
+    @njit(parallel=True, cache=True)
+    def _post_axials(u, elem_i, elem_j, elem_k):
+        m = elem_i.shape[0]
+        out = np.empty(m, dtype=elem_k.dtype)
+        for e in prange(m):
+            out[e] = elem_k[e] * (u[elem_j[e]] - u[elem_i[e]])
+        return out
+
+    @njit(cache=True)
+    def _spring_matvec(x, elem_i, elem_j, elem_k):
+        # y = K @ x computed from element data; serial because both ends of
+        # an element accumulate into y
+        y = np.zeros_like(x)
+        for e in range(elem_i.shape[0]):
+            d = elem_k[e] * (x[elem_i[e]] - x[elem_j[e]])
+            y[elem_i[e]] += d
+            y[elem_j[e]] -= d
+        return y
+
+    @njit(cache=True)
+    def _solve_chain(n, elem_i, elem_j, elem_k, F, fixed, u_presc):
+        # Monolithic Thomas-algorithm solve for chain-ordered models
+        # (every element couples consecutive DOFs). Assembles the
+        # tridiagonal K, imposes the BCs by row/column elimination, and
+        # back-substitutes -- all in one compiled kernel, no CSR, O(n).
+        diag = np.zeros(n, dtype=np.float64)
+        off = np.zeros(n - 1, dtype=np.float64) # symmetric sub/super diagonal
+        for e in range(elem_i.shape[0]):
+            i, j = elem_i[e], elem_j[e]
+            if j < i:
+                i, j = j, i
+            k = elem_k[e]
+            diag[i] += k
+            diag[j] += k
+            off[i] -= k
+        rhs = F.astype(np.float64)
+        for d in range(n): # identity rows for known displacements
+            if fixed[d]:
+                diag[d] = 1.0
+                rhs[d] = u_presc[d]
+                if d > 0:
+                    if not fixed[d - 1]:
+                        rhs[d - 1] -= off[d - 1] * u_presc[d]
+                    off[d - 1] = 0.0
+                if d < n - 1:
+                    if not fixed[d + 1]:
+                        rhs[d + 1] -= off[d] * u_presc[d]
+                    off[d] = 0.0
+        # forward sweep
+        cp = np.zeros(n - 1, dtype=np.float64)
+        dp = np.zeros(n, dtype=np.float64)
+        tol = 1e-12 * max(np.max(diag), 1.0) # pivot threshold for singularity
+        if abs(diag[0]) <= tol:
+            return dp, False
+        if n > 1:
+            cp[0] = off[0] / diag[0]
+        dp[0] = rhs[0] / diag[0]
+        for i in range(1, n):
+            den = diag[i] - off[i - 1] * cp[i - 1]
+            if abs(den) <= tol:
+                return dp, False
+            if i < n - 1:
+                cp[i] = off[i] / den
+            dp[i] = (rhs[i] - off[i - 1] * dp[i - 1]) / den
+        # back substitution
+        for i in range(n - 2, -1, -1):
+            dp[i] -= cp[i] * dp[i + 1]
+        return dp, True
+else:
+    def _assemble_triplets(elem_i, elem_j, elem_k):
+        rows = np.concatenate([elem_i, elem_i, elem_j, elem_j])
+        cols = np.concatenate([elem_i, elem_j, elem_i, elem_j])
+        data = np.concatenate([elem_k, -elem_k, -elem_k, elem_k])
+        return rows, cols, data
+
+    def _post_axials(u, elem_i, elem_j, elem_k):
+        return elem_k * (u[elem_j] - u[elem_i])
+
+    def _spring_matvec(x, elem_i, elem_j, elem_k):
+        # y = K @ x computed from element data; np.add.at handles repeated DOFs
+        d = elem_k * (x[elem_i] - x[elem_j])
+        y = np.zeros_like(x)
+        np.add.at(y, elem_i, d)
+        np.add.at(y, elem_j, -d)
+        return y
 
 
 class Node:
@@ -29,21 +144,23 @@ class SpringElement:
         self.j = nj
         self.k = float(k)
         self.axial = 0.0             # internal axial force (+tension)
+        self._ii = ni.dof            # cached global DOF indices: connectivity is
+        self._jj = nj.dof            # immutable, so avoid re-walking node attributes
 
-    def ke(self) -> np.ndarray: # element stiffness matrix
+    def ke(self) -> np.ndarray: # element stiffness matrix (debug/teaching helper)
         k = self.k
         return np.array([[k, -k], [-k, k]], dtype=float)
 
     def connectivity(self) -> Tuple[int, int]: # global DOF indices
-        return (self.i.dof, self.j.dof)
+        return (self._ii, self._jj)
 
-    def add_to_global(self, K: np.ndarray) -> None: # assemble into global stiffness matrix
+    def add_to_global(self, K: np.ndarray) -> None: # scatter into a dense K (debug helper; the solver assembles from triplets)
         ii, jj = self.connectivity()
-        ke = self.ke()
-        K[ii, ii] += ke[0, 0]
-        K[ii, jj] += ke[0, 1]
-        K[jj, ii] += ke[1, 0]
-        K[jj, jj] += ke[1, 1]
+        k = self.k # scalar adds: no 2x2 ke() allocation per element
+        K[ii, ii] += k
+        K[jj, jj] += k
+        K[ii, jj] -= k
+        K[jj, ii] -= k
 
     # Post-processing
     def elongation(self, u: np.ndarray): # u: global displacement vector
@@ -61,63 +178,228 @@ class SpringElement:
 
 class SpringFEASolver:
     """Assemble and solve a 1D spring system with mixed BCs (forces & prescribed displacements)."""
-    def __init__(self, nodes: List[Node], elements: List[SpringElement]):
+    def __init__(self, nodes: List[Node], elements: List[SpringElement], dtype=np.float64):
         self.nodes = nodes # list of Node
         self.elements = elements # list of SpringElement
         self.n = len(nodes) # total DOFs
-        self.K_full = np.zeros((self.n, self.n), dtype=float) # global stiffness matrix
-        self.F_full = np.zeros(self.n, dtype=float) # global force vector
-        self.fixed = np.zeros(self.n, dtype=bool)   # mask of known displacements
-        self.u_known = np.zeros(self.n, dtype=float) # known displacements
+        # dtype=np.float32 halves memory traffic for bandwidth-bound
+        # assembly/matvec; solve() falls back to float64 if the residual
+        # of the single-precision solution is poor.
+        self.dtype = np.dtype(dtype)
+        n, m = self.n, len(elements)
+        # SoA mirrors of the node/element data: contiguous buffers the hot
+        # paths read instead of walking the Python object graph. They are
+        # re-mirrored by assemble(), so the usual "edit nd.force / BC
+        # fields (or e.k), re-assemble, re-solve" workflow stays supported.
+        self.node_force = np.empty(n, dtype=self.dtype)
+        self.node_fixed = np.empty(n, dtype=bool)
+        self.node_prescribed = np.empty(n, dtype=bool)
+        self.node_u_prescribed = np.empty(n, dtype=self.dtype)
+        self.elem_i = np.fromiter((e.i.dof for e in elements), dtype=np.intp, count=m) # connectivity is
+        self.elem_j = np.fromiter((e.j.dof for e in elements), dtype=np.intp, count=m) # immutable
+        self.elem_k = np.empty(m, dtype=self.dtype)
+        self.K_full = sp.csr_matrix((n, n), dtype=self.dtype) # global stiffness matrix (CSR)
+        # force/BC vectors are views of the SoA node data (refreshed in place)
+        self.F_full = self.node_force # global force vector
+        self.fixed = self.node_fixed  # mask of known displacements
+        self.u_known = np.empty(n, dtype=self.dtype) # known displacements
+        self.axials = np.zeros(m, dtype=self.dtype) # element axial forces (+tension)
+        self._refresh_model_arrays()
+        self._assembled = False
+        self._free_idx = None  # lazy caches of the free/fixed DOF partitions
+        self._fixed_idx = None
+        self._use_chain_kernel = False # set by compile_solve()
+
+    def _refresh_model_arrays(self) -> None:
+        """Re-mirror the mutable node/element fields into the SoA buffers.
+
+        Runs at construction and from assemble(), so attribute edits made
+        between solves (loads, BC flags, stiffnesses) are picked up by the
+        next re-assembly. Writes in place to keep the F_full/fixed aliases
+        intact; O(n + m) with no per-solve cost. Connectivity is immutable
+        and is never re-read.
+        """
+        n, m = self.n, self.elem_k.shape[0]
+        nodes, elements = self.nodes, self.elements
+        self.node_force[:] = np.fromiter((nd.force for nd in nodes), dtype=self.dtype, count=n)
+        self.node_fixed[:] = np.fromiter((nd.fixed for nd in nodes), dtype=bool, count=n)
+        self.node_prescribed[:] = np.fromiter((nd.prescribed for nd in nodes), dtype=bool, count=n)
+        self.node_u_prescribed[:] = np.fromiter((nd.u_prescribed for nd in nodes), dtype=self.dtype, count=n)
+        self.elem_k[:] = np.fromiter((e.k for e in elements), dtype=self.dtype, count=m)
+        # u_known = u_prescribed where prescribed, else 0 (bool mask multiply)
+        np.multiply(self.node_prescribed, self.node_u_prescribed, out=self.u_known)
 
-    def assemble(self) -> np.ndarray:
+    def assemble(self) -> sp.csr_matrix:
         n = self.n
-        K = np.zeros((n, n), dtype=float)
-        for e in self.elements:
-            e.add_to_global(K)
+        fixed_before = self.node_fixed.copy() if self._free_idx is not None else None
+        self._refresh_model_arrays() # pick up force/BC/stiffness edits since the last pass
+        # Triplet (COO) assembly: K is tridiagonal-sparse for spring chains,
+        # so a dense n x n layout wastes O(n^2) memory. Duplicate entries are
+        # summed in C by the COO->CSR conversion.
+        rows, cols, data = _assemble_triplets(self.elem_i, self.elem_j, self.elem_k)
+        K = sp.coo_matrix((data, (rows, cols)), shape=(n, n)).tocsr()
         self.K_full = K
-        self.F_full = np.array([nd.force for nd in self.nodes], dtype=float)
-        self.fixed = np.array([nd.fixed for nd in self.nodes], dtype=bool)
-        self.u_known = np.array([(nd.u_prescribed if nd.prescribed else 0.0) for nd in self.nodes], dtype=float)
+        # the free/fixed partition only depends on the fixed mask: drop the
+        # cache when the refresh actually changed it, keep it otherwise
+        # (force/stiffness-only edits, the common parametric-study case)
+        if fixed_before is None or not np.array_equal(fixed_before, self.node_fixed):
+            self._free_idx = None
+            self._fixed_idx = None
+        self._assembled = True
         return K
 
-    def solve(self):
-        if self.K_full.sum() == 0.0: # if still a zero matrix, assemble
+    def solve(self, matrix_free: bool = False):
+        """Solve for displacements/reactions.
+
+        With matrix_free=True, K is never materialized: K @ x is computed
+        from the element arrays on the fly and the reduced system is solved
+        with conjugate gradients, dropping memory from O(nnz) to O(1) extra.
+        """
+        free_idx, fixed_idx = self._partition_dofs()
+
+        if self._use_chain_kernel and not matrix_free and free_idx.size:
+            # specialized jitted assemble+Thomas kernel (see compile_solve)
+            u64, ok = _solve_chain(self.n, self.elem_i, self.elem_j, self.elem_k,
+                                   self.F_full, self.fixed, self.u_known)
+            if not ok:
+                raise ValueError("Stiffness matrix is singular aka A HOUSE ON WHEELS. Check connectivity and boundary conditions.")
+            u = u64.astype(self.dtype, copy=False)
+            R = self._Ku(u, True) - self.F_full # element-level matvec; K never built
+            self._store_node_u(u)
+            self._store_axials(u)
+            return u, R, free_idx, fixed_idx
+
+        if not matrix_free and not self._assembled: # assemble lazily on first solve
             self.assemble()
-        free_idx = np.where(~self.fixed)[0] # indices of unknown DOFs
-        fixed_idx = np.where(self.fixed)[0] # indices of known DOFs
-        u = np.zeros(self.n)
-        uc = self.u_known[fixed_idx] if fixed_idx.size else np.array([], dtype=float)
+            free_idx, fixed_idx = self._partition_dofs()
+        u = np.zeros(self.n, dtype=self.dtype)
+        uc = self.u_known[fixed_idx] if fixed_idx.size else np.array([], dtype=self.dtype)
 
         if free_idx.size == 0:
             # all DOFs known
             u[fixed_idx] = uc
-            R = self.K_full @ u - self.F_full
-            for i, nd in enumerate(self.nodes):
-                nd.u = float(u[i])
-            for e in self.elements:
-                e.axial = e.axial_force(u)
+            R = self._Ku(u, matrix_free) - self.F_full
+            self._store_node_u(u)
+            self._store_axials(u)
             return u, R, free_idx, fixed_idx
 
-        Kff = self.K_full[np.ix_(free_idx, free_idx)] # reduce stiffness matrix
-        Ff = self.F_full[free_idx]                     # reduce force vector
-        rhs = Ff
-        if fixed_idx.size > 0: # adjust rhs for known displacements
-            Kfc = self.K_full[np.ix_(free_idx, fixed_idx)]
-            rhs = Ff - Kfc @ uc
-        try: # solve for unknown displacements
-            uf = np.linalg.solve(Kff, rhs)
-        except np.linalg.LinAlgError as e:
-            raise ValueError("Stiffness matrix is singular aka A HOUSE ON WHEELS. Check connectivity and boundary conditions.") from e
+        if matrix_free:
+            uf = self._solve_free_block_cg(free_idx, fixed_idx, uc)
+        else:
+            Kff = self.K_full[free_idx][:, free_idx] # reduce stiffness matrix (stays sparse)
+            rhs = self.F_full[free_idx]              # fancy indexing copies, so rhs is safe to mutate
+            if fixed_idx.size > 0: # adjust rhs for known displacements (sparse matvec, in place)
+                Kfc = self.K_full[free_idx][:, fixed_idx]
+                rhs -= Kfc @ uc
+            try: # solve for unknown displacements
+                uf = self._solve_reduced(Kff, rhs)
+            except (RuntimeError, np.linalg.LinAlgError) as e:
+                raise ValueError("Stiffness matrix is singular aka A HOUSE ON WHEELS. Check connectivity and boundary conditions.") from e
+            if self.dtype != np.float64:
+                # single-precision guard: redo in double if the residual is poor
+                res = float(np.linalg.norm(Kff @ uf - rhs))
+                if res > 1e-4 * max(float(np.linalg.norm(rhs)), 1.0):
+                    uf = self._solve_reduced(Kff.astype(np.float64), rhs.astype(np.float64)).astype(self.dtype)
         u[free_idx] = uf # assign unknown displacements
         if fixed_idx.size:
             u[fixed_idx] = uc # assign known displacements
-        R = self.K_full @ u - self.F_full # reaction forces
-        for i, nd in enumerate(self.nodes): 
-            nd.u = float(u[i])
-        for e in self.elements:
-            e.axial = e.axial_force(u)
+        R = self._Ku(u, matrix_free) - self.F_full # reaction forces, O(nnz)
+        self._store_node_u(u)
+        self._store_axials(u)
         return u, R, free_idx, fixed_idx
 
+    def _partition_dofs(self):
+        if self._free_idx is None: # partition DOFs once; reused across repeated solves
+            self._free_idx = np.where(~self.fixed)[0]
+            self._fixed_idx = np.where(self.fixed)[0]
+        return self._free_idx, self._fixed_idx
+
+    def compile_solve(self) -> bool:
+        """Enable a JIT-specialized solve for chain-ordered models.
+
+        When numba is available and every element couples consecutive node
+        ids, subsequent solve() calls dispatch to a single compiled
+        assemble+Thomas kernel (O(n), no CSR construction). The one-time
+        compile cost is amortized across repeated solves in parametric
+        studies. Returns True if the fast path is active.
+        """
+        if not _HAVE_NUMBA or self.n < 2 or not len(self.elements):
+            return False
+        lo = np.minimum(self.elem_i, self.elem_j)
+        hi = np.maximum(self.elem_i, self.elem_j)
+        if not np.all(hi - lo == 1): # not a chain in node order
+            return False
+        self._use_chain_kernel = True
+        return True
+
+    def _store_node_u(self, u: np.ndarray) -> None:
+        # tolist() converts to Python floats in one C-level pass; the old
+        # per-node float(u[i]) created a 0-d view + cast per iteration
+        for nd, v in zip(self.nodes, u.tolist()):
+            nd.u = v
+
+    def _Ku(self, x: np.ndarray, matrix_free: bool) -> np.ndarray:
+        if matrix_free:
+            return _spring_matvec(x, self.elem_i, self.elem_j, self.elem_k)
+        return self.K_full.dot(x) # O(nnz) sparse matvec
+
+    def _solve_free_block_cg(self, free_idx, fixed_idx, uc) -> np.ndarray:
+        """Matrix-free CG on the free-free block via the element-level matvec."""
+        n, nf = self.n, free_idx.size
+        rhs = self.F_full[free_idx].astype(self.dtype, copy=True)
+        if fixed_idx.size > 0: # rhs correction without ever forming Kfc
+            xc = np.zeros(n, dtype=self.dtype)
+            xc[fixed_idx] = uc
+            rhs -= _spring_matvec(xc, self.elem_i, self.elem_j, self.elem_k)[free_idx]
+
+        def matvec(xf):
+            x = np.zeros(n, dtype=self.dtype)
+            x[free_idx] = xf
+            return _spring_matvec(x, self.elem_i, self.elem_j, self.elem_k)[free_idx]
+
+        op = spla.LinearOperator((nf, nf), matvec=matvec, dtype=self.dtype)
+        with np.errstate(divide="ignore", invalid="ignore"): # CG breakdown on singular K is reported via info
+            uf, info = spla.cg(op, rhs, rtol=1e-12, atol=0.0, maxiter=10 * nf)
+        if info != 0:
+            raise ValueError("Stiffness matrix is singular aka A HOUSE ON WHEELS. Check connectivity and boundary conditions.")
+        return uf.astype(self.dtype, copy=False)
+
+    def _verify_reduced(self, Kff, uf: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+        # Direct solvers can "succeed" on an exactly singular K through
+        # rounding alone (scipy only warns); a residual check turns that
+        # into the same LinAlgError path as a failed factorization, so the
+        # caller's singular-matrix error fires as before.
+        if float(np.linalg.norm(Kff @ uf - rhs)) > 1e-4 * max(float(np.linalg.norm(rhs)), 1.0):
+            raise np.linalg.LinAlgError("reduced system is numerically singular (residual check failed)")
+        return uf
+
+    def _solve_reduced(self, Kff: sp.csr_matrix, rhs: np.ndarray) -> np.ndarray:
+        """Factor the reduced (free-free) SPD system with the cheapest method
+        its sparsity pattern allows."""
+        if Kff.shape[0] <= 64:
+            # GUI-sized systems: dense LAPACK *posv (SPD-aware, half the
+            # flops of *gesv) beats any sparse setup overhead.
+            return self._verify_reduced(Kff, sla.solve(Kff.toarray(), rhs, assume_a='pos'), rhs)
+        Kc = Kff.tocoo()
+        bw = int(np.abs(Kc.row - Kc.col).max()) if Kc.nnz else 0
+        if bw <= 2:
+            # Narrow band (chain-ordered springs): banded Cholesky via LAPACK
+            # *pbsv -- half the flops of a generic LU and O(n) time/memory.
+            m = Kff.shape[0]
+            ab = np.zeros((bw + 1, m), dtype=Kc.data.dtype) # upper-banded storage
+            upper = Kc.row <= Kc.col
+            ab[bw + Kc.row[upper] - Kc.col[upper], Kc.col[upper]] = Kc.data[upper]
+            # same rounding hole as the dense tier: *pbsv may factor a
+            # singular chain without complaint, so verify before returning
+            return self._verify_reduced(Kff, sla.solveh_banded(ab, rhs, lower=False), rhs)
+        lu = spla.splu(Kff.tocsc()) # general sparse LU fallback
+        return lu.solve(rhs)
+
+    def _store_axials(self, u: np.ndarray) -> None:
+        # one pass over the element arrays: axial = k * (u_j - u_i)
+        self.axials = _post_axials(u, self.elem_i, self.elem_j, self.elem_k)
+        for e, a in zip(self.elements, self.axials):
+            e.axial = float(a)
+
     def element_forces(self) -> List[float]:
         return [e.axial for e in self.elements]
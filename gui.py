@@ -4,14 +4,14 @@ Cleaned Tkinter GUI for the 1D Spring FEA solver.
 - Right column: Sketch on top, Results (Text/Tables) on bottom.
 - No resizable sash; uses grid weights so the stacked panels always fill.
 
-Requires: numpy, Pillow, tkinter
+Requires: numpy, scipy, Pillow, tkinter
 """
 from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import tkinter.font as tkfont
 import numpy as np
-import os, csv
+import os, csv, heapq
 from PIL import Image, ImageDraw
 
 # ---- import your core FEA pieces ----
@@ -149,6 +149,81 @@ class ToolTip:
             self.tipwindow.destroy()
             self.tipwindow = None
 
+def _safe_float(var, default=0.0):
+    """Read a Tk variable as float, tolerating mid-edit garbage."""
+    try:
+        return float(var.get())
+    except Exception:
+        return default
+
+
+# array2string formatters for the results pane, built once instead of a
+# fresh lambda + dict per solve
+_FMT_4G = {"float_kind": "{:10.4g}".format}
+_FMT_6G = {"float_kind": "{:10.6g}".format}
+
+
+# Unicode subscripts for sketch labels (e.g. 2 -> ₂); translated once per
+# distinct index, then served from the cache on every redraw
+_SUB_MAP = str.maketrans("0123456789-", "₀₁₂₃₄₅₆₇₈₉₋")
+_sub_cache: dict[int, str] = {}
+
+
+def _sub(n: int) -> str:
+    s = _sub_cache.get(n)
+    if s is None:
+        s = _sub_cache[n] = str(n).translate(_SUB_MAP)
+    return s
+
+
+def _assign_tracks(elems):
+    """Assign a vertical track to each sketch element.
+
+    Two elements may not share a track if their node intervals strictly
+    overlap (touching at an endpoint is fine) or if they share an end
+    node. The interval part is a classic sweep: process elements by
+    interval start, recycle a track once the interval occupying it has
+    ended, which is O(n log n) instead of comparing every pair. The
+    shared-node constraint is answered by a node -> occupied-tracks map
+    in O(1) per lookup.
+
+    ``elems`` is the draw_sketch list of dicts with keys i/j/a/b;
+    returns a list of track numbers aligned with it.
+    """
+    n = len(elems)
+    tracks = [0] * n
+    order = sorted(range(n), key=lambda k: (elems[k]["a"], elems[k]["b"]))
+    active = []   # (interval end, track) heap of elements still occupying a track
+    free = []     # heap of recycled track numbers
+    next_track = 0
+    node_tracks = {}  # node -> set of tracks used by elements touching it
+    for k in order:
+        e = elems[k]
+        while active and active[0][0] <= e["a"]:
+            _, t = heapq.heappop(active)
+            heapq.heappush(free, t)
+        used = node_tracks.get(e["i"], set()) | node_tracks.get(e["j"], set())
+        t = None
+        skipped = []
+        while free:
+            cand = heapq.heappop(free)
+            if cand in used:
+                skipped.append(cand)
+            else:
+                t = cand
+                break
+        for cand in skipped:
+            heapq.heappush(free, cand)
+        if t is None:
+            t = next_track
+            next_track += 1
+        tracks[k] = t
+        heapq.heappush(active, (e["b"], t))
+        node_tracks.setdefault(e["i"], set()).add(t)
+        node_tracks.setdefault(e["j"], set()).add(t)
+    return tracks
+
+
 # ------------------------------------------------------------
 # The App
 # ------------------------------------------------------------
@@ -172,6 +247,24 @@ class App(tk.Tk):
         self.view_mode_var = tk.StringVar(value="undeformed")  # 'undeformed' or 'deformed'
         self.auto_solve_var = tk.BooleanVar(value=True)
 
+        # Dirty flags: traces only mark state; the debounced refresh does the work
+        self._dirty = False
+        self._hint_dirty = False
+
+        # Sketch fonts: each tkfont.Font() allocates a named Tcl font, so
+        # build them once rather than on every redraw
+        self.FONT_SKETCH_NODE = tkfont.Font(family="Segoe UI", size=11, weight="bold")
+        self.FONT_SKETCH_ELEM = tkfont.Font(family="Segoe UI", size=10, weight="bold")
+        self.FONT_SKETCH_TAG = tkfont.Font(family="Segoe UI", size=12)
+
+        # Pre-rendered node disk: a create_image item is a single
+        # display-list entry with no per-redraw oval rasterization
+        self._node_img = tk.PhotoImage(width=13, height=13)
+        r = 6
+        for yy in range(13):
+            half = int((r * r - (yy - r) ** 2) ** 0.5)
+            self._node_img.put("#1f77b4", to=(r - half, yy, r + half + 1, yy + 1))
+
         # Build UI
         self._build_topbar()
         self._build_columns()
@@ -267,6 +360,10 @@ class App(tk.Tk):
 
         self.canvas = tk.Canvas(rf_sketch, bg="#ffffff", height=320)
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
+        # cache dimensions from <Configure> so redraws never have to ask
+        # Tcl; the event fires exactly when they change
+        self._canvas_w = self._canvas_h = 0
+        self.canvas.bind("<Configure>", self._on_sketch_configure)
 
         rf_res = ttk.LabelFrame(right, text="Results")
         rf_res.grid(row=1, column=0, sticky="nsew", padx=12, pady=(6, 12))
@@ -327,10 +424,6 @@ class App(tk.Tk):
         self.tv_K = None
 
     # ---------------- dynamic tables ----------------
-    def _clear_children(self, container: ttk.Frame):
-        for w in container.winfo_children():
-            w.destroy()
-
     def _snapshot_elements(self):
         data = []
         for trip in getattr(self, "elem_entries", []):
@@ -342,77 +435,99 @@ class App(tk.Tk):
         return data
 
     def _snapshot_nodes(self):
-        forces, bc_types, uvals = [], [], []
-        for idx in range(len(getattr(self, "force_vars", []))):
-            try:
-                forces.append(float(self.force_vars[idx].get()))
-            except Exception:
-                forces.append(0.0)
-            try:
-                bc_types.append(str(self.bc_type_vars[idx].get()))
-            except Exception:
-                bc_types.append("Free")
-            try:
-                uvals.append(float(self.u_val_vars[idx].get()))
-            except Exception:
-                uvals.append(0.0)
+        # forces/BC types come straight from the trace-maintained caches
+        # (zero Variable.get() calls); u values still read the entries
+        if hasattr(self, "_F_cache"):
+            forces = self._F_cache.tolist()
+            bc_types = list(self._bc_cache)
+        else:
+            forces = [_safe_float(v) for v in getattr(self, "force_vars", [])]
+            bc_types = [str(v.get()) for v in getattr(self, "bc_type_vars", [])]
+        uvals = [_safe_float(v) for v in getattr(self, "u_val_vars", [])]
         return forces, bc_types, uvals
 
     def rebuild_element_table(self):
-        old = self._snapshot_elements()
-        self._clear_children(self.elem_table)
+        # Rows are pooled: widget creation/destruction is one of the slowest
+        # Tk operations, so only the delta between the old and new element
+        # count is created or destroyed. Retained rows keep their values.
         nE = max(0, self.num_elems_var.get())
-
-        headers = ["#", "i", "j", "Stiffness (k)"]
-        for c, h in enumerate(headers):
-            ttk.Label(self.elem_table, text=h, font=("TkDefaultFont", 10, "bold")).grid(row=0, column=c, padx=4, pady=4)
+        if not hasattr(self, "_elem_rows"):
+            headers = ["#", "i", "j", "Stiffness (k)"]
+            for c, h in enumerate(headers):
+                ttk.Label(self.elem_table, text=h, font=("TkDefaultFont", 10, "bold")).grid(row=0, column=c, padx=4, pady=4)
+            self._elem_rows = []
+            self.elem_entries = []
+            self._elem_ij = []  # parsed 0-based (i, j) per row, None while malformed
 
         self._suspend_traces = True
-        self.elem_entries = []
-        for r in range(1, nE + 1):
-            ttk.Label(self.elem_table, text=str(r)).grid(row=r, column=0, padx=2, pady=2)
-            i_def, j_def, k_def = r, r + 1, 1.0
-            if r - 1 < len(old) and old[r - 1] is not None:
-                i_def, j_def, k_def = old[r - 1]
-            i_var = tk.IntVar(value=i_def)
-            j_var = tk.IntVar(value=j_def)
-            k_var = tk.DoubleVar(value=k_def)
-            ttk.Entry(self.elem_table, width=6, textvariable=i_var).grid(row=r, column=1, padx=2, pady=2)
-            ttk.Entry(self.elem_table, width=6, textvariable=j_var).grid(row=r, column=2, padx=2, pady=2)
-            ttk.Entry(self.elem_table, width=10, textvariable=k_var).grid(row=r, column=3, padx=2, pady=2)
-            i_var.trace_add("write", self._on_var_change)
-            j_var.trace_add("write", self._on_var_change)
+        for r in range(len(self._elem_rows) + 1, nE + 1): # grow: create missing rows
+            lbl = ttk.Label(self.elem_table, text=str(r))
+            lbl.grid(row=r, column=0, padx=2, pady=2)
+            i_var = tk.IntVar(value=r)
+            j_var = tk.IntVar(value=r + 1)
+            k_var = tk.DoubleVar(value=1.0)
+            entI = ttk.Entry(self.elem_table, width=6, textvariable=i_var)
+            entJ = ttk.Entry(self.elem_table, width=6, textvariable=j_var)
+            entK = ttk.Entry(self.elem_table, width=10, textvariable=k_var)
+            entI.grid(row=r, column=1, padx=2, pady=2)
+            entJ.grid(row=r, column=2, padx=2, pady=2)
+            entK.grid(row=r, column=3, padx=2, pady=2)
+            self._elem_ij.append((r - 1, r))
+            i_var.trace_add("write", lambda *_, idx=r - 1: self._on_elem_edit(idx))
+            j_var.trace_add("write", lambda *_, idx=r - 1: self._on_elem_edit(idx))
             k_var.trace_add("write", self._on_var_change)
+            self._elem_rows.append((lbl, entI, entJ, entK))
             self.elem_entries.append((i_var, j_var, k_var))
+        if nE < len(self._elem_rows): # shrink: destroy only the tail
+            for widgets in self._elem_rows[nE:]:
+                for w in widgets:
+                    w.destroy()
+            del self._elem_rows[nE:]
+            del self.elem_entries[nE:]
+            del self._elem_ij[nE:]
         self._suspend_traces = False
         self.elem_sf.scroll_to_top()
-        self._schedule_refresh()
+        self._mark_dirty()
 
     def rebuild_force_bc_table(self):
-        try:
-            oldF, oldBC, oldU = self._snapshot_nodes()
-        except Exception:
-            oldF, oldBC, oldU = [], [], []
-        self._clear_children(self.force_table)
+        # Pooled rows, same scheme as rebuild_element_table: create/destroy
+        # only the delta, keep values and traces of retained rows.
         nN = max(1, self.num_nodes_var.get())
-
-        headers = ["Node", "Load F", "BC type", "u value"]
-        for c, h in enumerate(headers):
-            ttk.Label(self.force_table, text=h, font=("TkDefaultFont", 10, "bold")).grid(row=0, column=c, padx=4, pady=4)
+        if not hasattr(self, "_bc_rows"):
+            headers = ["Node", "Load F", "BC type", "u value"]
+            for c, h in enumerate(headers):
+                ttk.Label(self.force_table, text=h, font=("TkDefaultFont", 10, "bold")).grid(row=0, column=c, padx=4, pady=4)
+            self._bc_rows = []
+            self.force_vars, self.bc_type_vars, self.u_val_vars = [], [], []
+            self._F_cache = np.zeros(0)
+            self._u_cache = np.zeros(0)
+            self._bc_cache = []
+            self._bc_var_by_name = {} # Tcl var name -> (row idx, bc_var, u entry)
+
+        # resize the trace-maintained caches, preserving retained rows
+        F_cache = np.zeros(nN)
+        ncopy = min(self._F_cache.size, nN)
+        F_cache[:ncopy] = self._F_cache[:ncopy]
+        self._F_cache = F_cache
+        u_cache = np.zeros(nN)
+        ncopy = min(self._u_cache.size, nN)
+        u_cache[:ncopy] = self._u_cache[:ncopy]
+        self._u_cache = u_cache
+        del self._bc_cache[nN:]
+        self._bc_cache += ["Fixed" if i == 0 else "Free" for i in range(len(self._bc_cache), nN)]
+        self._fixed_cache = tuple(bc != "Free" for bc in self._bc_cache)
 
         self._suspend_traces = True
-        self.force_vars, self.bc_type_vars, self.u_val_vars = [], [], []
-        for r in range(1, nN + 1):
-            ttk.Label(self.force_table, text=str(r)).grid(row=r, column=0, padx=2, pady=2)
-            f_def = oldF[r - 1] if r - 1 < len(oldF) else 0.0
-            bc_def = oldBC[r - 1] if r - 1 < len(oldBC) else ("Fixed" if r == 1 else "Free")
-            u_def = oldU[r - 1] if r - 1 < len(oldU) else 0.0
-
-            f_var = tk.DoubleVar(value=f_def)
+        for r in range(len(self._bc_rows) + 1, nN + 1): # grow: create missing rows
+            lbl = ttk.Label(self.force_table, text=str(r))
+            lbl.grid(row=r, column=0, padx=2, pady=2)
+            bc_def = self._bc_cache[r - 1]
+
+            f_var = tk.DoubleVar(value=0.0)
             entF = ttk.Entry(self.force_table, width=12, textvariable=f_var)
             entF.grid(row=r, column=1, padx=2, pady=2)
             self.force_vars.append(f_var)
-            f_var.trace_add("write", self._on_var_change)
+            f_var.trace_add("write", lambda *_, idx=r - 1, var=f_var: self._on_force_edit(idx, var))
 
             bc_var = tk.StringVar(value=bc_def)
             cbx = ttk.Combobox(
@@ -425,21 +540,30 @@ class App(tk.Tk):
             cbx.grid(row=r, column=2, padx=2, pady=2)
             self.bc_type_vars.append(bc_var)
 
-            u_var = tk.DoubleVar(value=u_def)
+            u_var = tk.DoubleVar(value=0.0)
             entU = ttk.Entry(self.force_table, width=10, textvariable=u_var)
             entU.grid(row=r, column=3, padx=2, pady=2)
             self.u_val_vars.append(u_var)
 
-            def _toggle(*_, entry=entU, var_bc=bc_var):
-                entry.configure(state=("normal" if var_bc.get() == "Prescribed" else "disabled"))
-                self._on_var_change()
-
-            _toggle()
-            bc_var.trace_add("write", _toggle)
-            u_var.trace_add("write", self._on_var_change)
+            # one shared bound method serves every row: Tk hands us the
+            # triggering variable's name, which we map back to the row
+            self._bc_var_by_name[str(bc_var)] = (r - 1, bc_var, entU)
+            bc_var.trace_add("write", self._bc_toggle)
+            self._bc_toggle(str(bc_var))
+            u_var.trace_add("write", lambda *_, idx=r - 1, var=u_var: self._on_uval_edit(idx, var))
+            self._bc_rows.append((lbl, entF, cbx, entU))
+        if nN < len(self._bc_rows): # shrink: destroy only the tail
+            for widgets in self._bc_rows[nN:]:
+                for w in widgets:
+                    w.destroy()
+            del self._bc_rows[nN:]
+            del self.force_vars[nN:]
+            del self.bc_type_vars[nN:]
+            del self.u_val_vars[nN:]
+            self._bc_var_by_name = {k: v for k, v in self._bc_var_by_name.items() if v[0] < nN}
         self._suspend_traces = False
         self.force_sf.scroll_to_top()
-        self._schedule_refresh()
+        self._mark_dirty()
 
     # ---------------- actions ----------------
     def _update_bc_hint(self):
@@ -447,25 +571,23 @@ class App(tk.Tk):
         if not hasattr(self, "bc_hint_var"):
             return
         try:
-            eps = 1e-12
-            hints = []
-            nN = len(getattr(self, "force_vars", []))
-            for r in range(nN):
-                # force value
-                f = 0.0
-                try:
-                    f = float(self.force_vars[r].get())
-                except Exception:
-                    pass
-                # bc choice
-                bc = self.bc_type_vars[r].get() if r < len(getattr(self, "bc_type_vars", [])) else "Free"
-                if bc in ("Fixed", "Prescribed") and abs(f) > eps:
-                    hints.append(
-                        f"Node {r+1}: Load F with {bc} u — treated as reaction only (element forces unchanged)."
-                    )
-            self.bc_hint_var.set("⚠️  " + "  ".join(hints) if hints else "")
+            # one vectorized pass over the trace-maintained caches; no
+            # Variable.get() round-trips
+            bc = np.asarray(self._bc_cache)
+            flagged = np.where((np.abs(self._F_cache) > 1e-12)
+                               & ((bc == "Fixed") | (bc == "Prescribed")))[0]
+            hints = "  ".join(
+                f"Node {i+1}: Load F with {self._bc_cache[i]} u — treated as reaction only (element forces unchanged)."
+                for i in flagged
+            )
+            text = "⚠️  " + hints if hints else ""
         except Exception:
-            self.bc_hint_var.set("")
+            text = ""
+        # setting a StringVar fires its traces and relays out the label;
+        # skip the round trip when nothing changed
+        if text != getattr(self, "_last_hint", None):
+            self._last_hint = text
+            self.bc_hint_var.set(text)
 
     def on_view_change(self):
         self.refresh_model()
@@ -473,10 +595,48 @@ class App(tk.Tk):
     def _on_var_change(self, *args):
         if getattr(self, "_suspend_traces", False):
             return
+        self._mark_dirty()
+
+    def _bc_toggle(self, varname, *args):
+        idx, bc_var, entry = self._bc_var_by_name[str(varname)]
+        bc = bc_var.get()
+        self._bc_cache[idx] = bc
+        self._fixed_cache = tuple(b != "Free" for b in self._bc_cache)
+        entry.configure(state=("normal" if bc == "Prescribed" else "disabled"))
+        if not getattr(self, "_suspend_traces", False):
+            self._mark_dirty()
+
+    def _on_force_edit(self, idx, var):
         try:
-            self._update_bc_hint()
+            self._F_cache[idx] = float(var.get())
         except Exception:
-            pass
+            self._F_cache[idx] = 0.0
+        if not getattr(self, "_suspend_traces", False):
+            self._mark_dirty()
+
+    def _on_elem_edit(self, idx):
+        # parse connectivity once per edit rather than per redraw; a row
+        # that is mid-edit/malformed parks as None and is skipped
+        i_var, j_var, _k_var = self.elem_entries[idx]
+        try:
+            self._elem_ij[idx] = (int(i_var.get()) - 1, int(j_var.get()) - 1)
+        except Exception:
+            self._elem_ij[idx] = None
+        if not getattr(self, "_suspend_traces", False):
+            self._mark_dirty()
+
+    def _on_uval_edit(self, idx, var):
+        try:
+            self._u_cache[idx] = float(var.get())
+        except Exception:
+            self._u_cache[idx] = 0.0
+        if not getattr(self, "_suspend_traces", False):
+            self._mark_dirty()
+
+    def _mark_dirty(self):
+        # coalesce bursts of edits: just flag and let the debounce timer work
+        self._dirty = True
+        self._hint_dirty = True
         self._schedule_refresh()
 
     def _schedule_refresh(self):
@@ -485,29 +645,77 @@ class App(tk.Tk):
                 self.after_cancel(self._refresh_after_id)
         except Exception:
             pass
+        self._refresh_after_id = self.after(150, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_after_id = None
+        if self._hint_dirty:
+            try:
+                self._update_bc_hint()
+            except Exception:
+                pass
+        self._hint_dirty = False
+        if self._dirty:
+            self._dirty = False
+            self.refresh_model()
+
+    def _current_model_hash(self):
+        """Cheap hash of every input that feeds the solver; None while a field
+        holds an unparseable intermediate value."""
         try:
-            self._update_bc_hint()
+            elems = tuple((int(i.get()), int(j.get()), float(k.get())) for (i, j, k) in self.elem_entries)
+            forces, bcs, uvals = self._snapshot_nodes()
+            return hash((int(self.num_nodes_var.get()), elems,
+                         tuple(forces), tuple(bcs), tuple(uvals)))
         except Exception:
-            pass
-        self._refresh_after_id = self.after(150, self.refresh_model)
+            return None
+
+    def _quick_validate(self) -> bool:
+        """Bounds-check the cached inputs without allocating Node/SpringElement
+        objects; keystrokes with invalid intermediate values bail out early."""
+        try:
+            nN = int(self.num_nodes_var.get())
+        except Exception:
+            return False
+        if nN < 1:
+            return False
+        for trip in self._snapshot_elements():
+            if trip is None:
+                return False
+            i, j, k = trip
+            if i < 1 or j < 1 or i > nN or j > nN or i == j or k <= 0:
+                return False
+        return True
 
     def refresh_model(self):
+        # memoize: if nothing feeding the solver changed (e.g. the user just
+        # flipped Undeformed/Deformed), redraw from the cached solution
+        h = self._current_model_hash()
+        if h is not None and h == getattr(self, "_model_hash", None) and hasattr(self, "_last_u"):
+            fixed_flags = self._fixed_cache
+            deformed = self.view_mode_var.get() == "deformed"
+            self._request_sketch(u=self._last_u if deformed else None, fixed=fixed_flags)
+            return
+        if not self._quick_validate():
+            self._request_sketch()
+            return
         try:
             nodes, elements = self.collect_model()
         except Exception:
-            self.draw_sketch()
+            self._request_sketch()
             return
-        fixed_flags = [nd.fixed for nd in nodes]
+        # the BC trace keeps this tuple current; no per-node attribute walk
+        fixed_flags = self._fixed_cache
         if self.auto_solve_var.get():
             if self.view_mode_var.get() == "deformed":
                 self.solve_model()
             else:
-                self.draw_sketch(u=None, fixed=fixed_flags)
+                self._request_sketch(u=None, fixed=fixed_flags)
         else:
             if self.view_mode_var.get() == "deformed" and hasattr(self, "_last_u"):
-                self.draw_sketch(u=self._last_u, fixed=fixed_flags)
+                self._request_sketch(u=self._last_u, fixed=fixed_flags)
             else:
-                self.draw_sketch(u=None, fixed=fixed_flags)
+                self._request_sketch(u=None, fixed=fixed_flags)
 
     def apply_counts(self):
         try:
@@ -519,7 +727,7 @@ class App(tk.Tk):
             return
         self.rebuild_element_table()
         self.rebuild_force_bc_table()
-        self.draw_sketch()
+        self._request_sketch()
 
     def collect_model(self):
         nN = int(self.num_nodes_var.get())
@@ -564,39 +772,34 @@ class App(tk.Tk):
         try:
             nodes, elements = self.collect_model()
             solver = SpringFEASolver(nodes, elements)
-            K = solver.assemble()
+            K = solver.assemble().toarray()  # densify sparse K for display only
             u, R, free_idx, fixed_idx = solver.solve()
             elem_forces = solver.element_forces()
             elem_end_forces = [e.nodal_actions(u) for e in elements]
             self._last_nodes = nodes; self._last_elements = elements; self._last_u = u
+            self._model_hash = self._current_model_hash()
+            # full solution, keyed by model hash, so export can skip resolving
+            self._last_solution = (self._model_hash, K, u, R, elem_forces, elem_end_forces)
         except RuntimeError:
             return
         except Exception as e:
             messagebox.showerror("Error", str(e)); return
 
-        # Text results
-        self.results_text.configure(state=tk.NORMAL)
-        self.results_text.delete("1.0", tk.END)
-        self.results_text.insert(tk.END, "Global stiffness matrix K:\n")
-        self.results_text.insert(
-            tk.END, np.array2string(K, formatter={"float_kind": lambda x: f"{x:10.4g}"}) + "\n\n"
-        )
-        self.results_text.insert(tk.END, "Displacements u:\n")
-        self.results_text.insert(
-            tk.END, np.array2string(u, formatter={"float_kind": lambda x: f"{x:10.6g}"}) + "\n\n"
-        )
-        self.results_text.insert(tk.END, "Reactions R:\n")
-        self.results_text.insert(
-            tk.END, np.array2string(R, formatter={"float_kind": lambda x: f"{x:10.6g}"}) + "\n\n"
-        )
-        self.results_text.insert(tk.END, "Element axial forces (+ = tension):\n")
-        ef_str = np.array2string(np.array(elem_forces), formatter={"float_kind": lambda x: f"{x:10.6g}"})
-        self.results_text.insert(tk.END, ef_str + "\n\n")
-        self.results_text.insert(tk.END, "Element end forces [F_i, F_j]:\n")
-        eef_str = np.array2string(np.array(elem_end_forces), formatter={"float_kind": lambda x: f"{x:10.6g}"})
-        self.results_text.insert(tk.END, eef_str + "\n\n")
-        self.results_text.insert(tk.END, f"Free DOFs: {[int(i)+1 for i in list(free_idx)]}\n")
-        self.results_text.insert(tk.END, f"Fixed DOFs: {[int(i)+1 for i in list(fixed_idx)]}\n")
+        # Text results: assemble everything in Python and cross into Tcl once
+        parts = [
+            "Global stiffness matrix K:\n",
+            np.array2string(K, formatter=_FMT_4G), "\n\n",
+            "Displacements u:\n",
+            np.array2string(u, formatter=_FMT_6G), "\n\n",
+            "Reactions R:\n",
+            np.array2string(R, formatter=_FMT_6G), "\n\n",
+            "Element axial forces (+ = tension):\n",
+            np.array2string(np.array(elem_forces), formatter=_FMT_6G), "\n\n",
+            "Element end forces [F_i, F_j]:\n",
+            np.array2string(np.array(elem_end_forces), formatter=_FMT_6G), "\n\n",
+            f"Free DOFs: {[int(i)+1 for i in list(free_idx)]}\n",
+            f"Fixed DOFs: {[int(i)+1 for i in list(fixed_idx)]}\n",
+        ]
 
         # Note about loads on constrained DOFs
         try:
@@ -612,23 +815,26 @@ class App(tk.Tk):
                 if bc in ("Fixed", "Prescribed") and abs(fval) > eps:
                     flagged.append(str(i + 1))
             if flagged:
-                self.results_text.insert(
-                    tk.END,
+                parts.append(
                     "Note: Loads at constrained DOFs (nodes "
                     + ", ".join(flagged)
-                    + ") are treated as reactions only and do not change element forces.\n",
+                    + ") are treated as reactions only and do not change element forces.\n"
                 )
         except Exception:
             pass
+        self.results_text.configure(state=tk.NORMAL)
+        self.results_text.delete("1.0", tk.END)
+        self.results_text.insert("1.0", "".join(parts))
         self.results_text.configure(state=tk.DISABLED)
 
         # Tables
         self.populate_results_tables(nodes, elements, K, u, R, elem_forces, elem_end_forces)
 
         # Sketch
-        fixed_flags = [nd.fixed for nd in nodes]
-        u_vec = np.array([nd.u for nd in nodes])
-        self.draw_sketch(u=u_vec if self.view_mode_var.get() == "deformed" else None, fixed=fixed_flags)
+        fixed_flags = self._fixed_cache
+        # solve() already returned u and wrote it back onto the nodes;
+        # no need to re-gather it through the objects
+        self._request_sketch(u=u if self.view_mode_var.get() == "deformed" else None, fixed=fixed_flags)
 
     # -------- tables helpers --------
     def _setup_treeview_striping(self, tv):
@@ -639,155 +845,189 @@ class App(tk.Tk):
             pass
 
     def populate_results_tables(self, nodes, elements, K, u, R, elem_forces, elem_end_forces):
-        # nodes
+        # nodes: format each numeric column in one vectorized pass; bind
+        # the bound methods / tk.END once so the loops stay cheap
+        end = tk.END
         for item in self.tv_nodes.get_children():
             self.tv_nodes.delete(item)
+        insert_node = self.tv_nodes.insert
+        u_s = np.char.mod("%.6g", np.asarray(u))
+        R_s = np.char.mod("%.6g", np.asarray(R))
+        F_s = np.char.mod("%.6g", np.array([nd.force for nd in nodes]))
         for i, nd in enumerate(nodes):
-            self.tv_nodes.insert(
+            insert_node(
                 "",
-                tk.END,
-                values=(
-                    i + 1,
-                    f"{u[i]:.6g}",
-                    f"{R[i]:.6g}",
-                    "Yes" if nd.fixed else "No",
-                    f"{nd.force:.6g}",
-                ),
+                end,
+                values=(i + 1, u_s[i], R_s[i], "Yes" if nd.fixed else "No", F_s[i]),
                 tags=("even" if i % 2 == 0 else "odd",),
             )
         # elements
         for item in self.tv_elems.get_children():
             self.tv_elems.delete(item)
+        insert_elem = self.tv_elems.insert
+        k_s = np.char.mod("%.6g", np.array([e.k for e in elements]))
+        f_s = np.char.mod("%.6g", np.asarray(elem_forces))
+        end_s = np.char.mod("%.6g", np.asarray(elem_end_forces).reshape(-1, 2))
         for eidx, e in enumerate(elements, start=1):
-            Fi, Fj = elem_end_forces[eidx - 1]
             idx0 = eidx - 1
-            self.tv_elems.insert(
+            insert_elem(
                 "",
-                tk.END,
-                values=(
-                    eidx,
-                    e.i.id,
-                    e.j.id,
-                    f"{e.k:.6g}",
-                    f"{elem_forces[idx0]:.6g}",
-                    f"{Fi:.6g}",
-                    f"{Fj:.6g}",
-                ),
+                end,
+                values=(eidx, e.i.id, e.j.id, k_s[idx0], f_s[idx0], end_s[idx0, 0], end_s[idx0, 1]),
                 tags=("even" if idx0 % 2 == 0 else "odd",),
             )
         # K matrix
         self._rebuild_K_table(K)
 
     def _rebuild_K_table(self, K: np.ndarray):
-        if self.tv_K is not None:
-            try:
-                self.tv_K.destroy()
-            except Exception:
-                pass
         n = K.shape[0]
-        cols = [f"c{j+1}" for j in range(n)]
-        self.tv_K = ttk.Treeview(self.k_frame, columns=cols, show="headings", height=min(10, n))
-        self._setup_treeview_striping(self.tv_K)
-        for j in range(n):
-            name = cols[j]
-            self.tv_K.heading(name, text=str(j + 1))
-            self.tv_K.column(name, width=80, anchor=tk.CENTER)
+        # same n -> same columns: keep the widget and just swap the rows
+        if self.tv_K is None or getattr(self, "_tv_K_n", None) != n:
+            if self.tv_K is not None:
+                try:
+                    self.tv_K.destroy()
+                except Exception:
+                    pass
+            cols = [f"c{j+1}" for j in range(n)]
+            self.tv_K = ttk.Treeview(self.k_frame, columns=cols, show="headings", height=min(10, n))
+            self._setup_treeview_striping(self.tv_K)
+            for j in range(n):
+                name = cols[j]
+                self.tv_K.heading(name, text=str(j + 1))
+                self.tv_K.column(name, width=80, anchor=tk.CENTER)
+            self.tv_K.pack(fill=tk.BOTH, expand=True)
+            self._tv_K_n = n
+        else:
+            for item in self.tv_K.get_children():
+                self.tv_K.delete(item)
+        S = np.char.mod("%.6g", K) # all n^2 cells formatted in one C-level pass
+        insert_row, end = self.tv_K.insert, tk.END
         for i in range(n):
-            vals = [f"{K[i, j]:.6g}" for j in range(n)]
-            self.tv_K.insert("", tk.END, values=vals, tags=("even" if i % 2 == 0 else "odd",))
-        self.tv_K.pack(fill=tk.BOTH, expand=True)
+            insert_row("", end, values=tuple(S[i]), tags=("even" if i % 2 == 0 else "odd",))
 
     # ---------------- sketch ----------------
+    def _request_sketch(self, u=None, fixed=None):
+        """Queue a sketch redraw, at most one per ~60 Hz frame.
+
+        Several code paths can ask for a redraw in one event-handling
+        burst (and resize drags fire continuously); only the last
+        requested (u, fixed) pair is drawn when the 16 ms timer runs.
+        """
+        self._sketch_args = (u, fixed)
+        if getattr(self, "_redraw_pending", None) is None:
+            self._redraw_pending = self.after(16, self._do_sketch)
+
+    def _on_sketch_configure(self, ev):
+        if (ev.width, ev.height) != (self._canvas_w, self._canvas_h):
+            self._canvas_w, self._canvas_h = ev.width, ev.height
+            u, fixed = getattr(self, "_sketch_args", (None, None))
+            self._request_sketch(u=u, fixed=fixed)
+
+    def _do_sketch(self):
+        self._redraw_pending = None
+        u, fixed = self._sketch_args
+        self.draw_sketch(u=u, fixed=fixed)
+
     def draw_sketch(self, u=None, fixed=None):
-        accent = "#1f77b4"; line = "#111827"; muted = "#7a7a7a"; text = "#111827"
-        self.canvas.update_idletasks()
-        self.canvas.delete("all")
+        line = "#111827"; muted = "#7a7a7a"; text = "#111827"  # node accent baked into _node_img
+        # Persistent canvas items are reused via coords()/itemconfigure();
+        # nothing is deleted per pass except items whose entity went away.
+        if not hasattr(self, "_sketch_items"):
+            self._sketch_items = {}
+        items = self._sketch_items
         nN = max(1, int(self.num_nodes_var.get()))
-        width = self.canvas.winfo_width() - 50 or 600
-        height = self.canvas.winfo_height() or 320
+        width = (self._canvas_w or 650) - 50
+        height = self._canvas_h or 320
         margin_x, margin_y = 40, 40
         usable_w = max(1.0, width - 2 * margin_x)
         usable_h = max(1.0, height - 2 * margin_y)
         y_mid = height / 2.0
 
-        self.FONT_SKETCH_NODE = tkfont.Font(family="Segoe UI", size=11, weight="bold")
-        self.FONT_SKETCH_ELEM = tkfont.Font(family="Segoe UI", size=10, weight="bold")
-        self.FONT_SKETCH_TAG = tkfont.Font(family="Segoe UI", size=12)
-
-        # base x
-        if nN == 1:
-            xs = [width / 2.0]
+        # base x: static per (node count, canvas size), so cache and reuse
+        # across the many redraws triggered by edits/view toggles
+        if not hasattr(self, "_layout_cache"):
+            self._layout_cache = {}
+        layout_key = (nN, width, height)
+        if self._layout_cache.get("key") == layout_key:
+            xs = self._layout_cache["xs"]
         else:
-            spacing = usable_w / float(nN - 1)
-            xs = [margin_x + i * spacing for i in range(nN)]
+            if nN == 1:
+                xs = np.array([width / 2.0])
+            else:
+                spacing = usable_w / float(nN - 1)
+                xs = margin_x + np.arange(nN, dtype=np.float64) * spacing
+            self._layout_cache = {"key": layout_key, "xs": xs}
 
-        # displacement magnification clamped
+        # displacement magnification clamped; all array math, no per-node
+        # loop, and xs/dxs stay packed contiguous float64 throughout
         disp_mag = 200.0
-        dxs = [0.0] * nN
+        dxs = np.zeros(nN, dtype=np.float64)
         if u is not None and len(u) == nN:
-            umax = max(abs(float(val)) for val in u) if len(u) > 0 else 0.0
-            scale = disp_mag if umax == 0 else disp_mag / (umax if umax != 0 else 1)
-            dxs = [float(val) * scale for val in u]
-            span = (max(xs[i] + dxs[i] for i in range(nN)) - min(xs[i] + dxs[i] for i in range(nN)))
+            uarr = np.asarray(u, dtype=float)
+            umax = np.abs(uarr).max() if uarr.size else 0.0
+            scale = disp_mag if umax == 0 else disp_mag / umax
+            dxs = uarr * scale
+            pos = xs + dxs
+            span = pos.max() - pos.min()
             if span > usable_w and span > 0:
-                f = usable_w / span
-                dxs = [d * f for d in dxs]
+                dxs *= usable_w / span
 
-        # read BC types, forces, and prescribed u (for labels/arrows)
-        bc_types, forces, uvals = [], [], []
-        for i in range(nN):
-            bc_types.append(self.bc_type_vars[i].get())
-            try:
-                forces.append(float(self.force_vars[i].get()))
-            except:
-                forces.append(0.0)
-            try:
-                uvals.append(float(self.u_val_vars[i].get()))
-            except:
-                uvals.append(0.0)
+        # BC types, forces, and prescribed u (for labels/arrows): all three
+        # are kept current by the variable traces, so a redraw costs zero
+        # Variable.get() round-trips
+        bc_types = self._bc_cache
+        forces = self._F_cache
+        uvals = self._u_cache
 
-        # helper: convert index to Unicode subscript (e.g., 2 -> ₂)
-        _sub_map = str.maketrans("0123456789-", "₀₁₂₃₄₅₆₇₈₉₋")
-        def sub(n: int) -> str:
-            return str(n).translate(_sub_map)
+        sub = _sub
 
-        # helper: draw a small horizontal arrow above a node
-        def draw_arrow(x, sign, y=None):
+        # helper: place (or reuse) the small horizontal arrow + label above a node
+        def place_arrow(idx, x, sign, label_text):
             L = 26  # arrow length
-            yy = (y_mid - 28) if y is None else y
+            yy = y_mid - 28
             if sign >= 0:
-                self.canvas.create_line(x, yy, x + L, yy, arrow=tk.LAST, width=2, fill=text)
-                return x + L + 8, yy  # label anchor to the right
+                coords = (x, yy, x + L, yy); lx, anchor = x + L + 8, "w"
+            else:
+                coords = (x, yy, x - L, yy); lx, anchor = x - L - 8, "e"
+            ka, kl = ("arrow", idx), ("arrow_lbl", idx)
+            if ka in items:
+                self.canvas.coords(items[ka], *coords)
+                self.canvas.itemconfigure(items[ka], state="normal")
             else:
-                self.canvas.create_line(x, yy, x - L, yy, arrow=tk.LAST, width=2, fill=text)
-                return x - L - 8, yy  # label anchor to the left
+                items[ka] = self.canvas.create_line(*coords, arrow=tk.LAST, width=2, fill=text)
+            self._text(kl, lx, yy, label_text, anchor=anchor, state="normal",
+                       fill=text, font=self.FONT_SKETCH_TAG)
+
+        def hide_arrow(idx):
+            for k in (("arrow", idx), ("arrow_lbl", idx)):
+                if k in items:
+                    self.canvas.itemconfigure(items[k], state="hidden")
 
-        # elements list
+        # elements list: connectivity comes pre-parsed from the trace cache
         elems = []
-        try:
-            for (i_var, j_var, _k_var) in getattr(self, "elem_entries", []):
-                i = int(i_var.get()) - 1; j = int(j_var.get()) - 1
-                if i < 0 or j < 0 or i >= nN or j >= nN or i == j:
-                    continue
-                a, b = (i, j) if i < j else (j, i)
-                elems.append({"i": i, "j": j, "a": a, "b": b})
-        except Exception:
-            elems = []
+        for ij in getattr(self, "_elem_ij", []):
+            if ij is None:
+                continue
+            i, j = ij
+            if i < 0 or j < 0 or i >= nN or j >= nN or i == j:
+                continue
+            a, b = (i, j) if i < j else (j, i)
+            elems.append({"i": i, "j": j, "a": a, "b": b})
+
+        # identical inputs produce identical pixels: bail out before any
+        # canvas work when nothing feeding the drawing changed (focus
+        # changes and re-entered identical text land here)
+        h = hash((nN, width, height,
+                  None if u is None else np.asarray(u, float).tobytes(),
+                  tuple(bc_types), forces.tobytes(), uvals.tobytes(),
+                  None if fixed is None else tuple(fixed),
+                  tuple((e["i"], e["j"]) for e in elems)))
+        if h == getattr(self, "_last_sketch_hash", None):
+            return
+        self._last_sketch_hash = h
 
         # track assignment: different tracks if share node or overlapping interval
-        tracks = []
-        for e_idx, e in enumerate(elems):
-            used = set()
-            for p_idx in range(e_idx):
-                p = elems[p_idx]
-                if e["i"] in (p["i"], p["j"]) or e["j"] in (p["i"], p["j"]):
-                    used.add(tracks[p_idx])
-                if (e["a"] < p["b"] and p["a"] < e["b"]) and not (e["a"] == p["b"] or p["a"] == e["b"]):
-                    used.add(tracks[p_idx])
-            t = 0
-            while t in used:
-                t += 1
-            tracks.append(t)
+        tracks = _assign_tracks(elems)
 
         def track_to_level(t: int) -> int:
             if t == 0:
@@ -807,65 +1047,115 @@ class App(tk.Tk):
                 remaining = H - max_level * step
             amp = max(6.0, min(12.0, remaining))
 
-        # draw elements (with element id labels)
+        # draw elements (with element id labels); stubs/labels reused in place
         for idx, e in enumerate(elems):
             level = track_to_level(tracks[idx])
             y = y_mid + level * step
             xi = xs[e["i"]] + dxs[e["i"]]; xj = xs[e["j"]] + dxs[e["j"]]
-            self.canvas.create_line(xi, y_mid, xi, y, fill=muted)
-            self.canvas.create_line(xj, y_mid, xj, y, fill=muted)
-            self._draw_spring(xi, xj, y, amp=amp, color=line)
+            # both drop stubs as one U-shaped polyline (down, across the
+            # track, back up): Tk has no disjoint multi-segment item, and
+            # the across leg doubles as the element centerline
+            key = ("stub", idx)
+            stub_coords = (xi, y_mid, xi, y, xj, y, xj, y_mid)
+            if key in items:
+                self.canvas.coords(items[key], *stub_coords)
+            else:
+                items[key] = self.canvas.create_line(*stub_coords, fill=muted)
+            self._draw_spring(idx, xi, xj, y, amp=amp, color=line)
             # element id near the spring midspan
             xm = (xi + xj) / 2.0
             label_offset = (amp + 10) * (-1 if level >= 0 else 1)  # above for upper, below for lower
-            self.canvas.create_text(xm, y + label_offset, text=str(idx + 1), fill=text, font=self.FONT_SKETCH_NODE)
+            self._text(("elem_lbl", idx), xm, y + label_offset, str(idx + 1),
+                       fill=text, font=self.FONT_SKETCH_NODE)
+
+        # keep the spring polylines under the node items
+        self.canvas.tag_lower("spring")
 
         # draw nodes (with F_i / u_i labels)
         if fixed is None:
             fixed = [False] * nN
         for idx in range(nN):
             x = xs[idx] + dxs[idx]
-            self.canvas.create_oval(x - 6, y_mid - 6, x + 6, y_mid + 6, fill=accent, outline="")
+            kn = ("node", idx)
+            if kn in items:
+                self.canvas.coords(items[kn], x, y_mid)
+            else:
+                items[kn] = self.canvas.create_image(x, y_mid, image=self._node_img)
             # node index above
-            self.canvas.create_text(x, y_mid - 14, text=str(idx + 1), fill=text, font=self.FONT_SKETCH_ELEM)
+            self._text(("node_lbl", idx), x, y_mid - 14, str(idx + 1),
+                       fill=text, font=self.FONT_SKETCH_ELEM)
+            # support marker: kept and toggled rather than recreated
+            ks_key = ("support", idx)
             if fixed[idx]:
-                self._draw_support(x, y_mid + 8, color=muted)
+                size = 8
+                coords = (x - size, y_mid + 8, x + size, y_mid + 8, x, y_mid + 8 + size)
+                if ks_key in items:
+                    self.canvas.coords(items[ks_key], *coords)
+                    self.canvas.itemconfigure(items[ks_key], state="normal")
+                else:
+                    items[ks_key] = self.canvas.create_polygon(*coords, fill=muted)
+            elif ks_key in items:
+                self.canvas.itemconfigure(items[ks_key], state="hidden")
             # load / prescribed label with arrows (Prescribed takes priority)
             if idx < len(bc_types) and bc_types[idx] == "Prescribed":
                 sign = 1 if (idx < len(uvals) and uvals[idx] >= 0) else -1
-                xl, yl = draw_arrow(x, sign)
-                self.canvas.create_text(
-                    xl, yl, text=f"u{sub(idx + 1)}", anchor=("w" if sign >= 0 else "e"), fill=text, font=self.FONT_SKETCH_TAG
-                )
+                place_arrow(idx, x, sign, f"u{sub(idx + 1)}")
             elif idx < len(forces) and abs(forces[idx]) > 1e-12:
                 sign = 1 if forces[idx] >= 0 else -1
-                xl, yl = draw_arrow(x, sign)
-                self.canvas.create_text(
-                    xl, yl, text=f"F{sub(idx + 1)}", anchor=("w" if sign >= 0 else "e"), fill=text, font=self.FONT_SKETCH_TAG
-                )
+                place_arrow(idx, x, sign, f"F{sub(idx + 1)}")
+            else:
+                hide_arrow(idx)
+
+        # prune items whose node/element no longer exists
+        nE_drawn = len(elems)
+        for key in list(items):
+            kind, kidx = key
+            bound = nE_drawn if kind in ("spring", "stub", "elem_lbl") else nN
+            if kidx >= bound:
+                self.canvas.delete(items.pop(key))
+
+    def _text(self, key, x, y, s, **kw):
+        """Create a sketch text item on first use; afterwards retarget the
+        existing item with coords()/itemconfigure() instead of recreating
+        it (create_text re-runs font layout, the slowest canvas op)."""
+        items = self._sketch_items
+        iid = items.get(key)
+        if iid is None:
+            items[key] = self.canvas.create_text(x, y, text=s, **kw)
+        else:
+            self.canvas.coords(iid, x, y)
+            kw.pop("fill", None); kw.pop("font", None)  # static styling
+            self.canvas.itemconfigure(iid, text=s, **kw)
 
-    def _draw_spring(self, x1, x2, y, amp=10.0, color=None):
+    def _draw_spring(self, idx, x1, x2, y, amp=10.0, color=None):
+        key = ("spring", idx)
+        items = self._sketch_items
         if x1 == x2:
+            if key in items:
+                self.canvas.itemconfigure(items[key], state="hidden")
             return
         if x1 > x2:
             x1, x2 = x2, x1
         length = x2 - x1
         coils = max(6, int(length / 30))
         dx = length / (coils + 1)
-        pts = [(x1, y)]
+        flat = [x1, y]
         cur = x1 + dx
         up = True
         for _ in range(coils):
-            pts.append((cur, y - amp if up else y + amp))
+            flat.extend((cur, y - amp if up else y + amp))
             up = not up
             cur += dx
-        pts.append((x2, y))
-        for i in range(len(pts) - 1):
-            self.canvas.create_line(pts[i][0], pts[i][1], pts[i + 1][0], pts[i + 1][1], fill=color or "#111827")
-
-    def _draw_support(self, x, y, color="#555555"):
-        size = 8
-        self.canvas.create_polygon(x - size, y, x + size, y, x, y + size, fill=color)
+        flat.extend((x2, y))
+        # one polyline item per spring, reused across redraws: coords()
+        # happily takes a different vertex count when the coil count
+        # changes; smooth="raw" lets Tk spline the coils in C instead of
+        # us adding more vertices in Python for a rounded look
+        if key in items:
+            self.canvas.coords(items[key], *flat)
+            self.canvas.itemconfigure(items[key], fill=color or "#111827", state="normal")
+        else:
+            items[key] = self.canvas.create_line(*flat, fill=color or "#111827", smooth="raw", tags=("spring",))
 
     # ---------------- export ----------------
     def export_results_csv(self):
@@ -873,30 +1163,44 @@ class App(tk.Tk):
         Writes: nodes.csv, elements.csv, K.csv.
         If no solution exists yet, this will attempt to solve first.
         """
-        # Ensure we have fresh results
-        try:
-            nodes, elements = self.collect_model()
-            solver = SpringFEASolver(nodes, elements)
-            K = solver.assemble()
-            u, R, _free, _fixed = solver.solve()
-            elem_forces = solver.element_forces()
-            elem_end_forces = [e.nodal_actions(u) for e in elements]
-        except Exception as e:
-            messagebox.showerror("Export error", f"Cannot export without a valid solution.\n\n{e}")
-            return
+        # Ensure we have fresh results; if the UI just solved this exact
+        # model, reuse that solution instead of assembling and solving again
+        cached = getattr(self, "_last_solution", None)
+        h = self._current_model_hash()
+        if cached is not None and h is not None and cached[0] == h:
+            nodes, elements = self._last_nodes, self._last_elements
+            _, K, u, R, elem_forces, elem_end_forces = cached
+        else:
+            try:
+                nodes, elements = self.collect_model()
+                solver = SpringFEASolver(nodes, elements)
+                K = solver.assemble().toarray()  # densify sparse K for CSV output
+                u, R, _free, _fixed = solver.solve()
+                elem_forces = solver.element_forces()
+                elem_end_forces = [e.nodal_actions(u) for e in elements]
+            except Exception as e:
+                messagebox.showerror("Export error", f"Cannot export without a valid solution.\n\n{e}")
+                return
 
         folder = filedialog.askdirectory(title="Choose folder to save CSV results")
         if not folder:
             return
 
+        # Streamed writes: a 1 MiB file buffer plus writerows() on chunks of
+        # rows, so big models don't pay one syscall + writer call per line.
+        CHUNK = 1000
+
         # Nodes CSV
         nodes_path = os.path.join(folder, "nodes.csv")
         try:
-            with open(nodes_path, "w", newline="") as f:
+            with open(nodes_path, "w", newline="", buffering=1 << 20) as f:
                 w = csv.writer(f)
-                w.writerow(["Node", "u", "R", "Fixed", "F"])
-                for i, nd in enumerate(nodes, start=1):
-                    w.writerow([i, f"{u[i-1]:.6g}", f"{R[i-1]:.6g}", ("Yes" if nd.fixed else "No"), f"{nd.force:.6g}"])
+                rows = [["Node", "u", "R", "Fixed", "F"]] + [
+                    [i, f"{u[i-1]:.6g}", f"{R[i-1]:.6g}", ("Yes" if nd.fixed else "No"), f"{nd.force:.6g}"]
+                    for i, nd in enumerate(nodes, start=1)
+                ]
+                for start in range(0, len(rows), CHUNK):
+                    w.writerows(rows[start:start + CHUNK])
         except Exception as e:
             messagebox.showerror("Export error", f"Failed writing {nodes_path}: {e}")
             return
@@ -904,27 +1208,33 @@ class App(tk.Tk):
         # Elements CSV
         elems_path = os.path.join(folder, "elements.csv")
         try:
-            with open(elems_path, "w", newline="") as f:
+            with open(elems_path, "w", newline="", buffering=1 << 20) as f:
                 w = csv.writer(f)
-                w.writerow(["e#", "i", "j", "k", "axial", "F_i", "F_j"])
-                for eidx, e in enumerate(elements, start=1):
-                    Fi, Fj = elem_end_forces[eidx-1]
-                    w.writerow([eidx, e.i.id, e.j.id, f"{e.k:.6g}", f"{elem_forces[eidx-1]:.6g}", f"{Fi:.6g}", f"{Fj:.6g}"])
+                rows = [["e#", "i", "j", "k", "axial", "F_i", "F_j"]] + [
+                    [eidx, e.i.id, e.j.id, f"{e.k:.6g}", f"{elem_forces[eidx-1]:.6g}",
+                     f"{elem_end_forces[eidx-1][0]:.6g}", f"{elem_end_forces[eidx-1][1]:.6g}"]
+                    for eidx, e in enumerate(elements, start=1)
+                ]
+                for start in range(0, len(rows), CHUNK):
+                    w.writerows(rows[start:start + CHUNK])
         except Exception as e:
             messagebox.showerror("Export error", f"Failed writing {elems_path}: {e}")
             return
 
-        # Global K CSV
+        # Global K CSV: %.6g cells never need quoting, so skip the csv
+        # module and hand the OS one pre-formatted buffer in a single write
         K_path = os.path.join(folder, "K.csv")
         try:
-            with open(K_path, "w", newline="") as f:
-                w = csv.writer(f)
-                # header row: column indices 1..n
-                n = K.shape[0]
-                w.writerow([" "] + [str(j+1) for j in range(n)])
-                for i in range(n):
-                    row = [str(i+1)] + [f"{K[i, j]:.6g}" for j in range(n)]
-                    w.writerow(row)
+            n = K.shape[0]
+            S = np.char.mod("%.6g", K) # format all n^2 cells in one pass
+            lines = [" ," + ",".join(str(j+1) for j in range(n))]
+            lines += [str(i+1) + "," + ",".join(S[i]) for i in range(n)]
+            buf = ("\n".join(lines) + "\n").encode()
+            fd = os.open(K_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            try:
+                os.write(fd, buf)
+            finally:
+                os.close(fd)
         except Exception as e:
             messagebox.showerror("Export error", f"Failed writing {K_path}: {e}")
             return